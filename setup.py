@@ -0,0 +1,31 @@
+"""Optional mypyc build for SoyScope's hot-path modules.
+
+Project metadata lives in pyproject.toml. Set ``SOYSCOPE_MYPYC=1`` when
+building/installing to compile the listed modules to C extensions with mypyc
+(requires ``mypy`` and a C compiler); otherwise the package installs as pure
+Python. pip's isolated build environment does not include mypy, so install it
+(with setuptools and wheel) first and build with ``--no-build-isolation``.
+"""
+
+import os
+
+from setuptools import setup
+
+MYPYC_MODULES = [
+    "src/soyscope/novelty.py",
+]
+
+ext_modules = []
+if os.environ.get("SOYSCOPE_MYPYC") == "1":
+    try:
+        from mypyc.build import mypycify
+    except ImportError as e:
+        raise RuntimeError(
+            "SOYSCOPE_MYPYC=1 needs mypy in the build environment: run "
+            "`pip install mypy \"setuptools>=68.0\" wheel` and then "
+            "`SOYSCOPE_MYPYC=1 pip install --no-build-isolation .`"
+        ) from e
+
+    ext_modules = mypycify(MYPYC_MODULES)
+
+setup(ext_modules=ext_modules)
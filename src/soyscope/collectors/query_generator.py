@@ -12,7 +12,7 @@ import logging
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, Sequence
 
 logger = logging.getLogger(__name__)
 
@@ -216,7 +216,9 @@ SECTOR_KEYWORDS: dict[str, list[str]] = {
 }
 
 _CURRENT_YEAR = datetime.now().year
-TIME_WINDOWS = [(2000, 2004), (2005, 2009), (2010, 2014), (2015, 2019), (2020, _CURRENT_YEAR)]
+TIME_WINDOWS: tuple[tuple[int, int], ...] = (
+    (2000, 2004), (2005, 2009), (2010, 2014), (2015, 2019), (2020, _CURRENT_YEAR),
+)
 
 # ---------------------------------------------------------------------------
 # Semantic / conceptual queries for *implicit* industrial relevance
@@ -299,6 +301,26 @@ class QueryPlan:
     target_apis: list[str] = field(default_factory=list)
 
 
+class QueryPlanBundle(tuple[QueryPlan, ...]):
+    """Immutable sequence of QueryPlans that also indexes them by ``query_type``.
+
+    ``by_type`` maps each query type to its plans (in plan order) so callers
+    need not re-filter the whole sequence.  The bundle is a tuple, so the
+    index cannot drift from its contents; slicing or concatenation returns a
+    plain tuple without ``by_type``.
+    """
+
+    by_type: dict[str, tuple[QueryPlan, ...]]
+
+    def __new__(cls, plans: Iterable[QueryPlan] = ()) -> QueryPlanBundle:
+        self = super().__new__(cls, plans)
+        grouped: dict[str, list[QueryPlan]] = {}
+        for plan in self:
+            grouped.setdefault(plan.query_type, []).append(plan)
+        self.by_type = {qtype: tuple(group) for qtype, group in grouped.items()}
+        return self
+
+
 # ---------------------------------------------------------------------------
 # Taxonomy loader
 # ---------------------------------------------------------------------------
@@ -412,8 +434,8 @@ def generate_govt_queries(derivative: str, sector: str) -> list[str]:
 
 def generate_full_query_plan(
     taxonomy_path: Path | None = None,
-    time_windows: list[tuple[int, int]] | None = None,
-) -> list[QueryPlan]:
+    time_windows: Sequence[tuple[int, int]] | None = None,
+) -> QueryPlanBundle:
     """Generate the complete query plan for historical build.
 
     Produces queries across all derivative x sector x time-window
@@ -495,13 +517,13 @@ def generate_full_query_plan(
         f"{len(derivatives)} derivatives x {len(sectors)} sectors "
         f"(+{len(SEMANTIC_QUERIES)} implicit semantic queries)"
     )
-    return plans
+    return QueryPlanBundle(plans)
 
 
 def generate_refresh_queries(
     since_year: int,
     taxonomy_path: Path | None = None,
-) -> list[QueryPlan]:
+) -> QueryPlanBundle:
     """Generate queries for incremental refresh since a given year.
 
     Uses a lighter query set than the full build (fewer synonym variants)
@@ -574,4 +596,4 @@ def generate_refresh_queries(
         ))
 
     logger.info(f"Generated {len(plans)} refresh queries since {since_year}")
-    return plans
+    return QueryPlanBundle(plans)
@@ -6,8 +6,10 @@ import asyncio
 import csv
 import logging
 import re
+import sqlite3
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, TextIO
 
 from rich.console import Console
 from rich.progress import BarColumn, Progress, SpinnerColumn, TextColumn
@@ -36,13 +38,24 @@ _TYPE_MAP: dict[str, SourceType] = {
 
 _DOI_RE = re.compile(r"(10\.\d{4,}/[^\s]+)")
 
+# Keyword cells use comma, semicolon or slash separators; surrounding spaces are dropped
+_KEYWORD_SPLIT = re.compile(r"\s*[,;/]\s*")
 
+# Raw deliverables written per insert_usb_deliverables_many() transaction
+_RAW_INSERT_CHUNK = 1000
+
+# Lower-cased cell values that the CSV export uses to mean "no data"
+_SENTINELS = frozenset({"#no match", "n/a", "na", "none"})
+
+
+# Category-style columns repeat a handful of values across thousands of rows
+@lru_cache(maxsize=256)
 def _clean_no_match(value: str | None) -> str | None:
-    """Return None if value is '#NO MATCH' or empty."""
+    """Return None if value is empty or a placeholder like '#NO MATCH' or 'N/A'."""
     if not value:
         return None
     v = value.strip()
-    if v.upper() == "#NO MATCH" or not v:
+    if not v or v.lower() in _SENTINELS:
         return None
     return v
 
@@ -69,6 +82,7 @@ def _parse_int(value: str | None) -> int | None:
         return None
 
 
+@lru_cache(maxsize=256)
 def _map_source_type(deliverable_type: str | None) -> SourceType:
     if not deliverable_type:
         return SourceType.PAPER
@@ -94,7 +108,7 @@ class USBDeliverablesImporter:
 
         # Split keywords on comma/semicolon
         raw_kw = row.get("Keywords", "")
-        keywords = [k.strip() for k in re.split(r"[,;/]", raw_kw) if k.strip()] if raw_kw else []
+        keywords = [k for k in _KEYWORD_SPLIT.split(raw_kw.strip()) if k] if raw_kw else []
 
         return USBDeliverable(
             title=row.get("Title", "").strip(),
@@ -151,14 +165,31 @@ class USBDeliverablesImporter:
             },
         )
 
-    async def import_from_csv(self, csv_path: Path, resolve_oa: bool = True) -> dict[str, Any]:
+    def _validate_path(self, csv_path: Path | str) -> Path:
+        """Return ``csv_path`` as a Path, raising FileNotFoundError if it is missing."""
+        path = Path(csv_path)
+        if not path.exists():
+            raise FileNotFoundError(f"CSV file not found: {path}")
+        return path
+
+    async def import_from_csv(
+        self, csv_path: Path | str | TextIO, resolve_oa: bool = True,
+    ) -> dict[str, Any]:
         """Import USB deliverables from CSV.
 
+        ``csv_path`` may also be an open text stream (e.g. ``io.StringIO``),
+        which is read as-is and not closed.
+
         Returns summary dict with counts of imported, skipped, etc.
         """
-        csv_path = Path(csv_path)
-        if not csv_path.exists():
-            raise FileNotFoundError(f"CSV file not found: {csv_path}")
+        if isinstance(csv_path, (str, Path)):
+            csv_path = self._validate_path(csv_path)
+            source_name = csv_path.name
+            with open(csv_path, encoding="utf-8-sig") as f:
+                rows = list(csv.DictReader(f))
+        else:
+            source_name = getattr(csv_path, "name", "<stream>")
+            rows = list(csv.DictReader(csv_path))
 
         # Start a search run
         run_id = self.db.start_search_run("import-usb-deliverables")
@@ -170,11 +201,6 @@ class USBDeliverablesImporter:
         doi_to_id = self.db.get_doi_to_id_map()
         dedup.load_existing(existing_dois, existing_titles, doi_to_id=doi_to_id)
 
-        # Read CSV
-        with open(csv_path, encoding="utf-8-sig") as f:
-            reader = csv.DictReader(f)
-            rows = list(reader)
-
         total = len(rows)
         raw_imported = 0
         raw_skipped = 0
@@ -182,7 +208,7 @@ class USBDeliverablesImporter:
         findings_skipped = 0
         oa_pairs: list[tuple[int, str]] = []  # (finding_id, doi) for Unpaywall
 
-        console.print(f"Importing [bold]{total}[/bold] USB deliverables from [bold]{csv_path.name}[/bold]...")
+        console.print(f"Importing [bold]{total}[/bold] USB deliverables from [bold]{source_name}[/bold]...")
 
         with Progress(
             SpinnerColumn(),
@@ -193,56 +219,77 @@ class USBDeliverablesImporter:
         ) as progress:
             task = progress.add_task("Importing deliverables", total=total)
 
+            deliverables: list[USBDeliverable] = []
             for row in rows:
                 try:
                     # Parse raw CSV row into USBDeliverable
                     deliverable = self._parse_row(row)
-                    if not deliverable.title:
-                        raw_skipped += 1
-                        progress.update(task, advance=1)
-                        continue
-
-                    # Insert into usb_deliverables table (raw record)
-                    raw_id = self.db.insert_usb_deliverable(deliverable)
-                    if raw_id is None:
-                        raw_skipped += 1
-                    else:
-                        raw_imported += 1
-
-                    # Create Paper for unified findings table
-                    paper = self._create_paper_from_deliverable(deliverable)
-
-                    # Dedup check (track source even on duplicates)
-                    is_dup, existing_id = dedup.is_duplicate(paper)
-                    if is_dup:
-                        if existing_id and paper.source_api:
-                            self.db.add_finding_source(existing_id, paper.source_api)
-                        findings_skipped += 1
-                        progress.update(task, advance=1)
-                        continue
-
-                    # Insert finding
-                    finding_id = self.db.insert_finding(paper)
-                    if finding_id is not None:
-                        findings_added += 1
-                        dedup.register(paper, finding_id)
-
-                        # Tag keywords
-                        for kw in deliverable.keywords:
-                            tag_id = self.db.insert_tag(kw.lower())
-                            self.db.link_finding_tag(finding_id, tag_id)
-
-                        # Collect DOI for Unpaywall resolution
-                        if paper.doi:
-                            oa_pairs.append((finding_id, paper.doi))
-                    else:
-                        findings_skipped += 1
-
                 except Exception as e:
-                    logger.warning("Failed to import row: %s", e)
+                    logger.warning("Failed to parse row: %s", e)
+                    deliverable = None
+                if deliverable is None or not deliverable.title:
                     raw_skipped += 1
+                    progress.update(task, advance=1)
+                    continue
+                deliverables.append(deliverable)
 
-                progress.update(task, advance=1)
+            for start in range(0, len(deliverables), _RAW_INSERT_CHUNK):
+                chunk = deliverables[start:start + _RAW_INSERT_CHUNK]
+
+                # Insert into usb_deliverables table (raw records), one transaction per chunk
+                try:
+                    inserted = self.db.insert_usb_deliverables_many(chunk)
+                except sqlite3.Error as e:
+                    # Retry row by row so one bad record cannot drop the whole chunk
+                    logger.warning("Batch insert of %d raw records failed, retrying per row: %s",
+                                   len(chunk), e)
+                    inserted = 0
+                    for deliverable in chunk:
+                        try:
+                            if self.db.insert_usb_deliverable(deliverable) is not None:
+                                inserted += 1
+                        except sqlite3.Error as row_err:
+                            logger.warning("Failed to insert raw record %r: %s",
+                                           deliverable.title, row_err)
+                raw_imported += inserted
+                raw_skipped += len(chunk) - inserted
+
+                for deliverable in chunk:
+                    try:
+                        # Create Paper for unified findings table
+                        paper = self._create_paper_from_deliverable(deliverable)
+
+                        # Dedup check (track source even on duplicates)
+                        is_dup, existing_id = dedup.is_duplicate(paper)
+                        if is_dup:
+                            if existing_id and paper.source_api:
+                                self.db.add_finding_source(existing_id, paper.source_api)
+                            findings_skipped += 1
+                            progress.update(task, advance=1)
+                            continue
+
+                        # Insert finding
+                        finding_id = self.db.insert_finding(paper)
+                        if finding_id is not None:
+                            findings_added += 1
+                            dedup.register(paper, finding_id)
+
+                            # Tag keywords
+                            for kw in deliverable.keywords:
+                                tag_id = self.db.insert_tag(kw.lower())
+                                self.db.link_finding_tag(finding_id, tag_id)
+
+                            # Collect DOI for Unpaywall resolution
+                            if paper.doi:
+                                oa_pairs.append((finding_id, paper.doi))
+                        else:
+                            findings_skipped += 1
+
+                    except Exception as e:
+                        logger.warning("Failed to import row: %s", e)
+                        findings_skipped += 1
+
+                    progress.update(task, advance=1)
 
         # Unpaywall OA resolution
         oa_resolved = 0
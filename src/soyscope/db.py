@@ -4,10 +4,11 @@ from __future__ import annotations
 
 import json
 import sqlite3
+import uuid
 from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Generator
+from typing import Any, Generator, Iterable
 
 from .models import (
     CheckoffProject,
@@ -234,19 +235,129 @@ CREATE INDEX IF NOT EXISTS idx_known_apps_derivative ON known_applications(deriv
 CREATE INDEX IF NOT EXISTS idx_known_apps_product ON known_applications(product_name);
 """
 
+_FINDING_COLUMNS = (
+    "title, abstract, year, doi, url, pdf_url, authors, venue, "
+    "source_api, source_type, citation_count, open_access_status, raw_metadata"
+)
+# Shared by insert_finding and insert_findings_batch so the column list and
+# parameter order are defined in one place.
+_INSERT_FINDING_SQL = (
+    f"INSERT INTO findings ({_FINDING_COLUMNS}) VALUES ({', '.join('?' * 13)})"
+)
+_INSERT_OR_IGNORE_FINDING_SQL = _INSERT_FINDING_SQL.replace("INSERT", "INSERT OR IGNORE", 1)
+
+
+def _finding_row(paper: Paper) -> tuple[Any, ...]:
+    """Parameters for ``_INSERT_FINDING_SQL`` in column order."""
+    return (
+        paper.title,
+        paper.abstract,
+        paper.year,
+        paper.doi,
+        paper.url,
+        paper.pdf_url,
+        paper.authors_json,
+        paper.venue,
+        paper.source_api,
+        paper.source_type.value if hasattr(paper.source_type, "value") else paper.source_type,
+        paper.citation_count,
+        paper.open_access_status.value if paper.open_access_status and hasattr(paper.open_access_status, "value") else paper.open_access_status,
+        paper.raw_metadata_json,
+    )
+
+
+_USB_DELIVERABLE_COLUMNS = (
+    "title, doi_link, deliverable_type, submitted_year, published_year, "
+    "month, journal_name, authors, combined_authors, funders, "
+    "usb_project_number, investment_category, key_categories, keywords, "
+    "pi_name, pi_email, organization, priority_area, raw_csv_row"
+)
+_INSERT_USB_DELIVERABLE_SQL = (
+    f"INSERT INTO usb_deliverables ({_USB_DELIVERABLE_COLUMNS}) VALUES ({', '.join('?' * 19)})"
+)
+_INSERT_OR_IGNORE_USB_DELIVERABLE_SQL = _INSERT_USB_DELIVERABLE_SQL.replace(
+    "INSERT", "INSERT OR IGNORE", 1,
+)
+
+
+def _usb_deliverable_row(deliverable: USBDeliverable) -> tuple[Any, ...]:
+    """Parameters for ``_INSERT_USB_DELIVERABLE_SQL`` in column order."""
+    return (
+        deliverable.title,
+        deliverable.doi_link,
+        deliverable.deliverable_type,
+        deliverable.submitted_year,
+        deliverable.published_year,
+        deliverable.month,
+        deliverable.journal_name,
+        deliverable.authors,
+        deliverable.combined_authors,
+        deliverable.funders,
+        deliverable.usb_project_number,
+        deliverable.investment_category,
+        deliverable.key_categories,
+        json.dumps(deliverable.keywords),
+        deliverable.pi_name,
+        deliverable.pi_email,
+        deliverable.organization,
+        deliverable.priority_area,
+        json.dumps(deliverable.raw_csv_row),
+    )
+
 
 class Database:
     """SQLite database manager for SoyScope."""
 
     def __init__(self, db_path: str | Path) -> None:
+        """Set up the database at ``db_path``.
+
+        On-disk databases are opened lazily, one connection per call.
+        ``":memory:"`` gives a private in-memory database, and ``file:`` URIs
+        are passed to SQLite as-is. In-memory databases are opened eagerly:
+        they use a shared-cache URI and an anchor connection, opened here and
+        held until :meth:`close`, keeps the data alive between calls.
+        """
+        self._uri: str | None = None
+        self._keepalive: sqlite3.Connection | None = None
         self.db_path = Path(db_path)
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        raw = str(db_path)
+        if raw == ":memory:":
+            self._uri = f"file:soyscope-{uuid.uuid4().hex}?mode=memory&cache=shared"
+        elif raw.startswith("file:"):
+            self._uri = raw
+        else:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        if self.in_memory:
+            self._keepalive = self._open()
+
+    @property
+    def in_memory(self) -> bool:
+        if self._uri is None:
+            return False
+        return self._uri.startswith("file::memory:") or "mode=memory" in self._uri
+
+    def _open(self) -> sqlite3.Connection:
+        if self._uri is not None:
+            return sqlite3.connect(self._uri, uri=True)
+        return sqlite3.connect(str(self.db_path))
+
+    def close(self) -> None:
+        """Release the anchor connection of an in-memory database."""
+        if self._keepalive is not None:
+            self._keepalive.close()
+            self._keepalive = None
 
     @contextmanager
     def connect(self) -> Generator[sqlite3.Connection, None, None]:
-        conn = sqlite3.connect(str(self.db_path))
+        conn = self._open()
         conn.row_factory = sqlite3.Row
-        conn.execute("PRAGMA journal_mode=WAL")
+        if self.in_memory:
+            # Nothing is fsynced in memory; just keep temp tables off disk too.
+            conn.execute("PRAGMA temp_store=MEMORY")
+        else:
+            conn.execute("PRAGMA journal_mode=WAL")
         conn.execute("PRAGMA foreign_keys=ON")
         try:
             yield conn
@@ -262,6 +373,15 @@ class Database:
             conn.executescript(SCHEMA_SQL)
             self._migrate_enrichments_schema(conn)
 
+    def copy_to(self, target: Database) -> None:
+        """Overwrite ``target`` with a snapshot of this database (schema and rows).
+
+        Uses SQLite's online backup, which is far cheaper than replaying
+        ``init_schema()`` when stamping out many fresh databases.
+        """
+        with self.connect() as src, target.connect() as dst:
+            src.backup(dst)
+
     def _migrate_enrichments_schema(self, conn: sqlite3.Connection) -> None:
         """Migrate enrichments from old per-finding uniqueness to per-tier uniqueness."""
         row = conn.execute(
@@ -314,27 +434,7 @@ class Database:
     def insert_finding(self, paper: Paper) -> int | None:
         with self.connect() as conn:
             try:
-                cur = conn.execute(
-                    """INSERT INTO findings
-                       (title, abstract, year, doi, url, pdf_url, authors, venue,
-                        source_api, source_type, citation_count, open_access_status, raw_metadata)
-                       VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                    (
-                        paper.title,
-                        paper.abstract,
-                        paper.year,
-                        paper.doi,
-                        paper.url,
-                        paper.pdf_url,
-                        paper.authors_json,
-                        paper.venue,
-                        paper.source_api,
-                        paper.source_type.value if hasattr(paper.source_type, "value") else paper.source_type,
-                        paper.citation_count,
-                        paper.open_access_status.value if paper.open_access_status and hasattr(paper.open_access_status, "value") else paper.open_access_status,
-                        paper.raw_metadata_json,
-                    ),
-                )
+                cur = conn.execute(_INSERT_FINDING_SQL, _finding_row(paper))
                 finding_id = cur.lastrowid
                 if finding_id and paper.source_api:
                     conn.execute(
@@ -528,6 +628,17 @@ class Database:
                 (finding_id, source_api),
             )
 
+    def add_finding_sources(self, pairs: Iterable[tuple[int, str]]) -> None:
+        """Record many (finding_id, source_api) pairs in one transaction."""
+        rows = list(pairs)
+        if not rows:
+            return
+        with self.connect() as conn:
+            conn.executemany(
+                "INSERT OR IGNORE INTO finding_sources (finding_id, source_api) VALUES (?, ?)",
+                rows,
+            )
+
     def get_finding_sources(self, finding_id: int) -> list[str]:
         """Return all source_api values for a finding."""
         with self.connect() as conn:
@@ -888,8 +999,8 @@ class Database:
     def insert_findings_batch(self, papers: list[Paper]) -> tuple[int, int]:
         """Insert multiple findings in a single transaction.
 
-        Uses executemany for the main insert, then handles finding_sources
-        tracking in a second pass. Checkoff papers typically have no DOIs,
+        Uses executemany for the main insert, then records finding_sources
+        for all new rows with one INSERT ... SELECT. Checkoff papers typically have no DOIs,
         so duplicates are rare; any DOI-based duplicates are silently skipped.
 
         Returns (inserted, skipped) tuple.
@@ -897,46 +1008,20 @@ class Database:
         if not papers:
             return (0, 0)
 
-        rows = [
-            (
-                paper.title,
-                paper.abstract,
-                paper.year,
-                paper.doi,
-                paper.url,
-                paper.pdf_url,
-                paper.authors_json,
-                paper.venue,
-                paper.source_api,
-                paper.source_type.value if hasattr(paper.source_type, "value") else paper.source_type,
-                paper.citation_count,
-                paper.open_access_status.value if paper.open_access_status and hasattr(paper.open_access_status, "value") else paper.open_access_status,
-                paper.raw_metadata_json,
-            )
-            for paper in papers
-        ]
+        rows = [_finding_row(paper) for paper in papers]
 
         with self.connect() as conn:
-            before = conn.execute("SELECT COUNT(*) FROM findings").fetchone()[0]
-            conn.executemany(
-                """INSERT OR IGNORE INTO findings
-                   (title, abstract, year, doi, url, pdf_url, authors, venue,
-                    source_api, source_type, citation_count, open_access_status, raw_metadata)
-                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                rows,
-            )
-            after = conn.execute("SELECT COUNT(*) FROM findings").fetchone()[0]
-            inserted = after - before
+            max_id_before = conn.execute("SELECT COALESCE(MAX(id), 0) FROM findings").fetchone()[0]
+            cur = conn.executemany(_INSERT_OR_IGNORE_FINDING_SQL, rows)
+            inserted = cur.rowcount
 
-            # Batch-insert finding_sources for all newly-inserted findings
-            source_apis = {p.source_api for p in papers if p.source_api}
-            for source_api in source_apis:
-                conn.execute(
-                    """INSERT OR IGNORE INTO finding_sources (finding_id, source_api)
-                       SELECT id, source_api FROM findings
-                       WHERE source_api = ? AND id > ?""",
-                    (source_api, before),
-                )
+            # Track sources for every newly-inserted finding in one statement
+            conn.execute(
+                """INSERT OR IGNORE INTO finding_sources (finding_id, source_api)
+                   SELECT id, source_api FROM findings
+                   WHERE id > ? AND source_api IS NOT NULL AND source_api != ''""",
+                (max_id_before,),
+            )
 
         skipped = len(papers) - inserted
         return (inserted, skipped)
@@ -950,39 +1035,23 @@ class Database:
     def insert_usb_deliverable(self, deliverable: USBDeliverable) -> int | None:
         with self.connect() as conn:
             try:
-                cur = conn.execute(
-                    """INSERT INTO usb_deliverables
-                       (title, doi_link, deliverable_type, submitted_year, published_year,
-                        month, journal_name, authors, combined_authors, funders,
-                        usb_project_number, investment_category, key_categories, keywords,
-                        pi_name, pi_email, organization, priority_area, raw_csv_row)
-                       VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                    (
-                        deliverable.title,
-                        deliverable.doi_link,
-                        deliverable.deliverable_type,
-                        deliverable.submitted_year,
-                        deliverable.published_year,
-                        deliverable.month,
-                        deliverable.journal_name,
-                        deliverable.authors,
-                        deliverable.combined_authors,
-                        deliverable.funders,
-                        deliverable.usb_project_number,
-                        deliverable.investment_category,
-                        deliverable.key_categories,
-                        json.dumps(deliverable.keywords),
-                        deliverable.pi_name,
-                        deliverable.pi_email,
-                        deliverable.organization,
-                        deliverable.priority_area,
-                        json.dumps(deliverable.raw_csv_row),
-                    ),
-                )
+                cur = conn.execute(_INSERT_USB_DELIVERABLE_SQL, _usb_deliverable_row(deliverable))
                 return cur.lastrowid
             except sqlite3.IntegrityError:
                 return None
 
+    def insert_usb_deliverables_many(self, deliverables: Iterable[USBDeliverable]) -> int:
+        """Insert raw deliverables in one transaction, skipping duplicates.
+
+        Returns the number of rows actually inserted.
+        """
+        rows = [_usb_deliverable_row(d) for d in deliverables]
+        if not rows:
+            return 0
+        with self.connect() as conn:
+            cur = conn.executemany(_INSERT_OR_IGNORE_USB_DELIVERABLE_SQL, rows)
+            return cur.rowcount
+
     def get_usb_deliverables_count(self) -> int:
         with self.connect() as conn:
             return conn.execute("SELECT COUNT(*) FROM usb_deliverables").fetchone()[0]
@@ -1054,24 +1123,20 @@ class Database:
 
             # Multi-source tracking stats
             try:
-                stats["findings_with_multiple_sources"] = conn.execute(
-                    """SELECT COUNT(*) FROM (
-                        SELECT finding_id FROM finding_sources
-                        GROUP BY finding_id HAVING COUNT(*) > 1
-                    )"""
-                ).fetchone()[0]
+                multi, avg = conn.execute(
+                    """WITH per_finding AS (
+                        SELECT COUNT(*) AS cnt FROM finding_sources GROUP BY finding_id
+                    )
+                    SELECT COALESCE(SUM(cnt > 1), 0), AVG(cnt) FROM per_finding"""
+                ).fetchone()
+                stats["findings_with_multiple_sources"] = multi
+                stats["avg_sources_per_finding"] = avg or 0.0
 
                 rows = conn.execute(
                     """SELECT source_api, COUNT(*) as cnt
                        FROM finding_sources GROUP BY source_api ORDER BY cnt DESC"""
                 ).fetchall()
                 stats["by_source_tracked"] = {r[0]: r[1] for r in rows}
-
-                stats["avg_sources_per_finding"] = conn.execute(
-                    """SELECT AVG(cnt) FROM (
-                        SELECT COUNT(*) as cnt FROM finding_sources GROUP BY finding_id
-                    )"""
-                ).fetchone()[0] or 0.0
             except Exception:
                 stats["findings_with_multiple_sources"] = 0
                 stats["by_source_tracked"] = {}
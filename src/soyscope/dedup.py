@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import re
+from array import array
 from typing import Any
 
 from rapidfuzz import fuzz
@@ -34,23 +35,52 @@ def is_duplicate_title(title_a: str, title_b: str, threshold: float = 90.0) -> b
     """Check if two titles are duplicates using fuzzy matching."""
     na = normalize_title(title_a)
     nb = normalize_title(title_b)
-    return fuzz.ratio(na, nb) >= threshold
+    # fuzz.ratio can never exceed 200*min/(la+lb) (the indel distance is at
+    # least the length gap), so very different lengths are rejected up front.
+    la, lb = len(na), len(nb)
+    if la + lb and 200.0 * min(la, lb) / (la + lb) < threshold:
+        return False
+    return fuzz.ratio(na, nb, score_cutoff=threshold) >= threshold
+
+
+_NO_ID = -1  # Stand-in for "no DB id" in the packed id array
 
 
 class Deduplicator:
-    """Deduplicates papers using DOI-first, then fuzzy title matching."""
+    """Deduplicates papers using DOI-first, then fuzzy title matching.
+
+    Seen titles are kept as parallel arrays (normalized titles plus a packed
+    ``array`` of DB ids) with a dict index for exact normalized-title hits,
+    so the fuzzy scan only runs when there is no exact match.
+    """
 
     def __init__(self, title_threshold: float = 90.0) -> None:
         self.title_threshold = title_threshold
         self._seen_dois: set[str] = set()
         self._doi_to_id: dict[str, int | None] = {}
-        self._seen_titles: list[tuple[int | None, str]] = []
+        self._titles: list[str] = []
+        self._ids = array("q")
+        self._title_index: dict[str, int] = {}
+
+    def _add_title(self, db_id: int | None, normalized: str) -> None:
+        self._title_index.setdefault(normalized, len(self._titles))
+        self._titles.append(normalized)
+        self._ids.append(_NO_ID if db_id is None else db_id)
+
+    def _id_at(self, pos: int) -> int | None:
+        db_id = self._ids[pos]
+        return None if db_id == _NO_ID else db_id
 
     def load_existing(self, dois: set[str], titles: list[tuple[int, str]],
                       doi_to_id: dict[str, int] | None = None) -> None:
         """Load existing DOIs and titles from the database."""
         self._seen_dois = {normalize_doi(d) for d in dois if d} - {None}
-        self._seen_titles = [(tid, normalize_title(t)) for tid, t in titles if t]
+        self._titles = []
+        self._ids = array("q")
+        self._title_index = {}
+        for tid, t in titles:
+            if t:
+                self._add_title(tid, normalize_title(t))
         if doi_to_id:
             for doi, fid in doi_to_id.items():
                 nd = normalize_doi(doi)
@@ -68,12 +98,16 @@ class Deduplicator:
         if ndoi and ndoi in self._seen_dois:
             return True, self._doi_to_id.get(ndoi)
 
-        # 2. Fuzzy title match
+        # 2. Exact normalized title, then fuzzy title match
         if paper.title:
             nt = normalize_title(paper.title)
-            for existing_id, existing_title in self._seen_titles:
-                if fuzz.ratio(nt, existing_title) >= self.title_threshold:
-                    return True, existing_id
+            pos = self._title_index.get(nt)
+            if pos is not None:
+                return True, self._id_at(pos)
+            for pos, existing_title in enumerate(self._titles):
+                if fuzz.ratio(nt, existing_title,
+                              score_cutoff=self.title_threshold) >= self.title_threshold:
+                    return True, self._id_at(pos)
 
         return False, None
 
@@ -84,7 +118,7 @@ class Deduplicator:
             self._seen_dois.add(ndoi)
             self._doi_to_id[ndoi] = db_id
         if paper.title:
-            self._seen_titles.append((db_id, normalize_title(paper.title)))
+            self._add_title(db_id, normalize_title(paper.title))
 
 
 def deduplicate_papers(papers: list[Paper], existing_dois: set[str] | None = None,
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from typing import Any
 
+import numpy as np
+
 
 def normalize_novelty_score(raw_score: Any) -> float | None:
     """Normalize novelty to 0.0-1.0 from either 0-1 or 0-100 scales."""
@@ -31,6 +33,12 @@ def predict_relevant_from_novelty(raw_score: Any, threshold: float = 0.7) -> boo
     return normalized is not None and normalized >= threshold
 
 
+def _score_or_nan(raw_score: Any) -> float:
+    """Normalize novelty, mapping missing/invalid scores to NaN."""
+    normalized = normalize_novelty_score(raw_score)
+    return np.nan if normalized is None else normalized
+
+
 def evaluate_labeled_findings(
     rows: list[dict[str, Any]],
     threshold: float = 0.7,
@@ -39,30 +47,26 @@ def evaluate_labeled_findings(
     if threshold < 0.0 or threshold > 1.0:
         raise ValueError("threshold must be between 0.0 and 1.0")
 
-    tp = fp = fn = tn = 0
-    with_novelty = 0
-    skipped_labels = 0
-
+    labeled: list[tuple[bool, Any]] = []
     for row in rows:
         label = str(row.get("label", "")).strip().lower()
-        if label not in {"relevant", "irrelevant"}:
-            skipped_labels += 1
-            continue
-
-        truth_relevant = label == "relevant"
-        normalized = normalize_novelty_score(row.get("novelty_score"))
-        if normalized is not None:
-            with_novelty += 1
-        pred_relevant = normalized is not None and normalized >= threshold
-
-        if truth_relevant and pred_relevant:
-            tp += 1
-        elif not truth_relevant and pred_relevant:
-            fp += 1
-        elif truth_relevant and not pred_relevant:
-            fn += 1
-        else:
-            tn += 1
+        if label in {"relevant", "irrelevant"}:
+            labeled.append((label == "relevant", row.get("novelty_score")))
+    skipped_labels = len(rows) - len(labeled)
+
+    # Confusion-matrix counting runs on boolean masks; NaN marks missing novelty.
+    truth = np.fromiter((t for t, _ in labeled), dtype=bool, count=len(labeled))
+    scores = np.fromiter(
+        (_score_or_nan(raw) for _, raw in labeled), dtype=float, count=len(labeled)
+    )
+    has_novelty = ~np.isnan(scores)
+    pred = scores >= threshold
+
+    tp = int(np.count_nonzero(truth & pred))
+    fp = int(np.count_nonzero(~truth & pred))
+    fn = int(np.count_nonzero(truth & ~pred))
+    tn = int(np.count_nonzero(~truth & ~pred))
+    with_novelty = int(np.count_nonzero(has_novelty))
 
     evaluated = tp + fp + fn + tn
     precision = tp / (tp + fp) if (tp + fp) else 0.0
@@ -8,13 +8,18 @@ combination was found — this is a potentially novel discovery.
 from __future__ import annotations
 
 import logging
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from difflib import SequenceMatcher
 from typing import Any
 
 logger = logging.getLogger(__name__)
 
+_PUNCT_RE = re.compile(r"[^\w\s]")
+_WS_RE = re.compile(r"\s+")
+
 
 @dataclass
 class NoveltyResult:
@@ -31,23 +36,33 @@ class NoveltyResult:
 def _normalize(text: str) -> str:
     """Lowercase, strip punctuation, collapse whitespace."""
     text = text.lower()
-    text = re.sub(r"[^\w\s]", " ", text)
-    text = re.sub(r"\s+", " ", text).strip()
+    text = _PUNCT_RE.sub(" ", text)
+    text = _WS_RE.sub(" ", text).strip()
     return text
 
 
-def _fuzzy_similarity(a: str, b: str) -> float:
-    """Return 0-1 similarity ratio between two strings."""
+def _fuzzy_similarity(a: str, b: str, *, normalized: bool = False) -> float:
+    """Return 0-1 similarity ratio between two strings.
+
+    Pass ``normalized=True`` when ``b`` has already been through
+    :func:`_normalize` to skip re-normalizing it.
+    """
     if not a or not b:
         return 0.0
-    return SequenceMatcher(None, _normalize(a), _normalize(b)).ratio()
+    return SequenceMatcher(None, _normalize(a), b if normalized else _normalize(b)).ratio()
+
 
+def _keyword_overlap(
+    text: str, keywords: list[str], *, normalized: bool = False,
+) -> tuple[float, list[str]]:
+    """Check how many keywords appear in text. Returns (fraction, matched_list).
 
-def _keyword_overlap(text: str, keywords: list[str]) -> tuple[float, list[str]]:
-    """Check how many keywords appear in text. Returns (fraction, matched_list)."""
+    Pass ``normalized=True`` when ``text`` has already been through
+    :func:`_normalize`.
+    """
     if not keywords or not text:
         return 0.0, []
-    text_lower = _normalize(text)
+    text_lower = text if normalized else _normalize(text)
     matched = [kw for kw in keywords if kw.lower() in text_lower]
     return len(matched) / len(keywords), matched
 
@@ -84,6 +99,12 @@ def score_finding_novelty(
             explanation="No title available for novelty scoring",
         )
 
+    # Normalize the finding text once instead of once per known app.
+    combined_lower = combined_text.lower()
+    norm_title = _normalize(title)
+    norm_abstract = _normalize(abstract)
+    norm_combined = f"{norm_title} {norm_abstract}".strip()
+
     best_score = 0.0
     best_product = None
     best_sector = None
@@ -100,27 +121,30 @@ def score_finding_novelty(
         product_sim = 0.0
         if app_product:
             # Check if product name appears directly in text
-            if app_product.lower() in combined_text.lower():
+            if app_product.lower() in combined_lower:
                 product_sim = 1.0
             else:
-                product_sim = _fuzzy_similarity(app_product, title) * 0.7
+                product_sim = _fuzzy_similarity(app_product, norm_title, normalized=True) * 0.7
 
         # --- Manufacturer matching ---
         mfr_sim = 0.0
         if app_manufacturer:
-            if app_manufacturer.lower() in combined_text.lower():
+            if app_manufacturer.lower() in combined_lower:
                 mfr_sim = 0.5
             else:
-                mfr_sim = _fuzzy_similarity(app_manufacturer, combined_text) * 0.3
+                mfr_sim = _fuzzy_similarity(app_manufacturer, norm_combined, normalized=True) * 0.3
 
         # --- Description similarity ---
-        desc_sim = _fuzzy_similarity(app_description, title) * 0.6
+        desc_sim = _fuzzy_similarity(app_description, norm_title, normalized=True) * 0.6
         if abstract:
-            desc_sim = max(desc_sim, _fuzzy_similarity(app_description, abstract) * 0.5)
+            desc_sim = max(
+                desc_sim,
+                _fuzzy_similarity(app_description, norm_abstract, normalized=True) * 0.5,
+            )
 
         # --- Category keyword matching ---
         cat_words = app_category.lower().split()
-        cat_overlap = sum(1 for w in cat_words if w in combined_text.lower()) / max(len(cat_words), 1)
+        cat_overlap = sum(1 for w in cat_words if w in combined_lower) / max(len(cat_words), 1)
         cat_sim = cat_overlap * 0.4
 
         # Composite similarity for this known app
@@ -137,7 +161,7 @@ def score_finding_novelty(
     sector_match_score = 0.0
     if sector_keywords:
         for sector_name, keywords in sector_keywords.items():
-            overlap_frac, matched = _keyword_overlap(combined_text, keywords)
+            overlap_frac, matched = _keyword_overlap(norm_combined, keywords, normalized=True)
             if overlap_frac > sector_match_score:
                 sector_match_score = overlap_frac
                 all_matched_keywords = matched
@@ -172,10 +196,30 @@ def score_finding_novelty(
     )
 
 
+# Per-process scoring context for parallel batches.  Set once per worker by
+# _init_scoring_worker so known_apps is pickled per worker, not per finding.
+_worker_known_apps: list[dict[str, Any]] = []
+_worker_sector_keywords: dict[str, list[str]] | None = None
+
+
+def _init_scoring_worker(
+    known_apps: list[dict[str, Any]],
+    sector_keywords: dict[str, list[str]] | None,
+) -> None:
+    global _worker_known_apps, _worker_sector_keywords
+    _worker_known_apps = known_apps
+    _worker_sector_keywords = sector_keywords
+
+
+def _score_in_worker(finding: dict[str, Any]) -> NoveltyResult:
+    return score_finding_novelty(finding, _worker_known_apps, _worker_sector_keywords)
+
+
 def score_findings_batch(
     findings: list[dict[str, Any]],
     known_apps: list[dict[str, Any]],
     sector_keywords: dict[str, list[str]] | None = None,
+    n_jobs: int = 1,
 ) -> list[NoveltyResult]:
     """Score novelty for a batch of findings.
 
@@ -187,15 +231,31 @@ def score_findings_batch(
         All rows from known_applications table.
     sector_keywords : dict, optional
         SECTOR_KEYWORDS dict for additional matching.
+    n_jobs : int
+        Worker processes to score with (default 1 = in-process).
+        Values <= 0 use every CPU.
 
     Returns
     -------
-    List of NoveltyResult, one per finding.
+    List of NoveltyResult, one per finding, in input order.
     """
-    results = []
-    for finding in findings:
-        result = score_finding_novelty(finding, known_apps, sector_keywords)
-        results.append(result)
+    workers = n_jobs if n_jobs > 0 else (os.cpu_count() or 1)
+    workers = min(workers, len(findings))
+
+    results: list[NoveltyResult]
+    if workers <= 1:
+        results = [
+            score_finding_novelty(finding, known_apps, sector_keywords)
+            for finding in findings
+        ]
+    else:
+        chunksize = max(1, len(findings) // (workers * 4))
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_scoring_worker,
+            initargs=(known_apps, sector_keywords),
+        ) as pool:
+            results = list(pool.map(_score_in_worker, findings, chunksize=chunksize))
 
     # Log summary
     if results:
@@ -215,6 +275,7 @@ def get_novel_findings(
     known_apps: list[dict[str, Any]],
     threshold: float = 70.0,
     sector_keywords: dict[str, list[str]] | None = None,
+    n_jobs: int = 1,
 ) -> list[NoveltyResult]:
     """Return only findings above the novelty threshold.
 
@@ -222,12 +283,14 @@ def get_novel_findings(
     ----------
     threshold : float
         Minimum novelty score to include (default 70).
+    n_jobs : int
+        Passed through to :func:`score_findings_batch`.
 
     Returns
     -------
     List of NoveltyResult sorted by novelty_score descending.
     """
-    all_results = score_findings_batch(findings, known_apps, sector_keywords)
+    all_results = score_findings_batch(findings, known_apps, sector_keywords, n_jobs=n_jobs)
     novel = [r for r in all_results if r.novelty_score >= threshold]
     novel.sort(key=lambda r: r.novelty_score, reverse=True)
     return novel
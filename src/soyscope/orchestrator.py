@@ -216,23 +216,22 @@ class SearchOrchestrator:
 
             if is_dup:
                 if existing_id:
-                    for source in sources_for_paper:
-                        self.db.add_finding_source(existing_id, source)
+                    self.db.add_finding_sources((existing_id, s) for s in sources_for_paper)
                 updated_count += 1
             else:
                 result_id = self.db.insert_finding(paper)
                 if result_id is not None:
                     new_count += 1
-                    for source in sources_for_paper:
-                        self.db.add_finding_source(result_id, source)
+                    self.db.add_finding_sources((result_id, s) for s in sources_for_paper)
                     dedup.register(paper, result_id)
                 else:
                     updated_count += 1
                     if paper.doi:
                         existing = self.db.get_finding_by_doi(paper.doi)
                         if existing:
-                            for source in sources_for_paper:
-                                self.db.add_finding_source(existing["id"], source)
+                            self.db.add_finding_sources(
+                                (existing["id"], s) for s in sources_for_paper
+                            )
 
         # Log query
         if run_id is not None:
@@ -23,8 +23,8 @@ class AGRISSource(BaseSource):
 
     BASE_URL = "https://agris.fao.org/search"
 
-    def __init__(self) -> None:
-        super().__init__()
+    def __init__(self, client: httpx.AsyncClient | None = None) -> None:
+        super().__init__(http_client=client)
 
     @property
     def name(self) -> str:
@@ -55,7 +55,7 @@ class AGRISSource(BaseSource):
         total_results = 0
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with self._http_client() as client:
                 response = await client.get(
                     self.BASE_URL,
                     params=params,
@@ -4,9 +4,13 @@ from __future__ import annotations
 
 import logging
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
 from typing import Any, Protocol, runtime_checkable
 
+import httpx
+
 from ..models import Paper
 
 logger = logging.getLogger(__name__)
@@ -46,9 +50,15 @@ class SearchSource(Protocol):
 class BaseSource(ABC):
     """Base class for search source adapters with common functionality."""
 
-    def __init__(self, api_key: str | None = None, email: str | None = None) -> None:
+    def __init__(
+        self,
+        api_key: str | None = None,
+        email: str | None = None,
+        http_client: httpx.AsyncClient | None = None,
+    ) -> None:
         self.api_key = api_key
         self.email = email
+        self.http_client = http_client
         self.logger = logging.getLogger(f"soyscope.sources.{self.name}")
 
     @property
@@ -67,6 +77,18 @@ class BaseSource(ABC):
         """Default: not supported."""
         return None
 
+    @asynccontextmanager
+    async def _http_client(self, timeout: float = 30.0) -> AsyncIterator[httpx.AsyncClient]:
+        """Yield the injected client, or a short-lived one closed on exit.
+
+        An injected ``http_client`` is owned by the caller and left open.
+        """
+        if self.http_client is not None:
+            yield self.http_client
+        else:
+            async with httpx.AsyncClient(timeout=timeout) as client:
+                yield client
+
     def _make_paper(self, **kwargs: Any) -> Paper:
         """Helper to create a Paper with source_api set."""
         return Paper(source_api=self.name, **kwargs)
@@ -25,8 +25,10 @@ class LensSource(BaseSource):
     SCHOLARLY_URL = "https://api.lens.org/scholarly/search"
     PATENT_URL = "https://api.lens.org/patent/search"
 
-    def __init__(self, api_key: str | None = None) -> None:
-        super().__init__(api_key=api_key)
+    def __init__(
+        self, api_key: str | None = None, client: httpx.AsyncClient | None = None,
+    ) -> None:
+        super().__init__(api_key=api_key, http_client=client)
 
     @property
     def name(self) -> str:
@@ -73,7 +75,7 @@ class LensSource(BaseSource):
         total_results = 0
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with self._http_client() as client:
                 response = await client.post(
                     self.SCHOLARLY_URL,
                     headers=headers,
@@ -134,7 +136,7 @@ class LensSource(BaseSource):
         total_results = 0
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with self._http_client() as client:
                 response = await client.post(
                     self.PATENT_URL,
                     headers=headers,
@@ -176,7 +178,7 @@ class LensSource(BaseSource):
         headers = self._auth_headers()
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with self._http_client() as client:
                 response = await client.post(
                     self.SCHOLARLY_URL,
                     headers=headers,
@@ -23,8 +23,8 @@ class OSTISource(BaseSource):
 
     BASE_URL = "https://www.osti.gov/api/v1/records"
 
-    def __init__(self) -> None:
-        super().__init__()
+    def __init__(self, client: httpx.AsyncClient | None = None) -> None:
+        super().__init__(http_client=client)
 
     @property
     def name(self) -> str:
@@ -54,7 +54,7 @@ class OSTISource(BaseSource):
         total_results = 0
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with self._http_client() as client:
                 response = await client.get(
                     self.BASE_URL,
                     params=params,
@@ -99,7 +99,7 @@ class OSTISource(BaseSource):
     async def get_by_doi(self, doi: str) -> Paper | None:
         headers = {"Accept": "application/json"}
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with self._http_client() as client:
                 response = await client.get(
                     self.BASE_URL,
                     params={"q": f'doi:"{doi}"', "rows": 1},
@@ -23,8 +23,10 @@ class PatentsViewSource(BaseSource):
 
     BASE_URL = "https://search.patentsview.org/api/v1/patent/"
 
-    def __init__(self, api_key: str | None = None) -> None:
-        super().__init__(api_key=api_key)
+    def __init__(
+        self, api_key: str | None = None, client: httpx.AsyncClient | None = None,
+    ) -> None:
+        super().__init__(api_key=api_key, http_client=client)
 
     @property
     def name(self) -> str:
@@ -72,7 +74,7 @@ class PatentsViewSource(BaseSource):
         total_results = 0
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with self._http_client() as client:
                 response = await client.post(
                     self.BASE_URL,
                     headers=headers,
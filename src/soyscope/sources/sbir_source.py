@@ -23,8 +23,8 @@ class SBIRSource(BaseSource):
 
     BASE_URL = "https://api.www.sbir.gov/public/api/awards"
 
-    def __init__(self) -> None:
-        super().__init__()
+    def __init__(self, client: httpx.AsyncClient | None = None) -> None:
+        super().__init__(http_client=client)
 
     @property
     def name(self) -> str:
@@ -53,7 +53,7 @@ class SBIRSource(BaseSource):
         total_results = 0
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with self._http_client() as client:
                 response = await client.get(
                     self.BASE_URL,
                     params=params,
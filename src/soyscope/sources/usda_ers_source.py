@@ -24,8 +24,10 @@ class USDAERSSource(BaseSource):
     BASE_URL = "https://api.ers.usda.gov/data/arms"
     SEARCH_URL = "https://api.nal.usda.gov/pubag/rest/search"
 
-    def __init__(self, api_key: str | None = None) -> None:
-        super().__init__(api_key=api_key)
+    def __init__(
+        self, api_key: str | None = None, client: httpx.AsyncClient | None = None,
+    ) -> None:
+        super().__init__(api_key=api_key, http_client=client)
 
     @property
     def name(self) -> str:
@@ -66,7 +68,7 @@ class USDAERSSource(BaseSource):
         total_results = 0
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with self._http_client() as client:
                 response = await client.get(
                     self.SEARCH_URL,
                     params=params,
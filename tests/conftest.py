@@ -0,0 +1,171 @@
+"""Shared pytest fixtures."""
+
+import csv
+import io
+from types import MappingProxyType
+
+import pytest
+
+from soyscope.collectors.query_generator import generate_full_query_plan
+from soyscope.collectors.usb_deliverables_importer import USBDeliverablesImporter
+from soyscope.db import Database
+from soyscope.models import Paper
+
+
+@pytest.fixture(scope="session")
+def full_plans_2020_2026():
+    """Full query plan for a single 2020-2026 window, built once per session.
+
+    Tests must treat the returned QueryPlans as read-only.
+    """
+    return generate_full_query_plan(time_windows=((2020, 2026),))
+
+
+@pytest.fixture
+def paper_factory():
+    """Build ``Paper`` objects from shared test defaults plus overrides."""
+
+    def make(**overrides):
+        fields = {"title": "Test paper", "doi": "10.1234/test", "source_api": "test"}
+        fields.update(overrides)
+        return Paper(**fields)
+
+    return make
+
+
+# Column layout of the USB deliverables CSV export.
+_FIELDNAMES = (
+    "Title",
+    "DOI Link",
+    "Type",
+    "Submitted Year",
+    "Published Year",
+    "Month",
+    "Journal Name",
+    "Authors",
+    "Combined Authors",
+    "Funders",
+    "Award Numbers",
+    "Smithbucklin Project Number",
+    "USB Project Number Lookup",
+    "USB #",
+    "Project Number",
+    "Target Area",
+    "Fiscal Year",
+    "Investment Category",
+    "Action Team",
+    "Program Name",
+    "Sub-Program Name",
+    "Key Categories",
+    "Keywords",
+    "PI Name",
+    "PI Email",
+    "Organization",
+    "Program Manager",
+    "Program Manager Email",
+    "Project Manager Email",
+    "Date of Last Change",
+    "Quarter",
+    "Date of Last PI Update",
+    "Status",
+    "Targeted Journal(s)",
+    "Submitted by Name",
+    "Priority Area",
+    "Submitted By Email",
+    "Current Program Manager",
+    "Do you need funds for publishing open access?",
+    "Project Manager",
+    "Created",
+    "Send Approval Notification",
+    "Re-email PM",
+    "Send Notification Email",
+    "Smartsheet Admin Email",
+    "Additional Project Numbers",
+    "Journal Response",
+)
+_BLANK_ROW = MappingProxyType({name: "" for name in _FIELDNAMES})
+
+# Process-wide named in-memory database holding the pristine schema.
+_SCHEMA_DB_URI = "file:soyscope_test?mode=memory&cache=shared"
+
+# Two sample deliverables: a DOI-bearing paper and a patent without a DOI.
+_ROWS = (
+    {
+        **_BLANK_ROW,
+        "Title": "Soy Protein Adhesive for Plywood",
+        "DOI Link": "https://doi.org/10.1234/soy.2023.001",
+        "Type": "Primary Research",
+        "Published Year": "2023",
+        "Month": "Jun",
+        "Journal Name": "Journal of Adhesion",
+        "Authors": "Smith, J., Doe, J.",
+        "Funders": "United Soybean Board",
+        "USB Project Number Lookup": "#NO MATCH",
+        "USB #": "2340-101-0001",
+        "Project Number": "2340-101-0001",
+        "Investment Category": "Industrial",
+        "Key Categories": "Adhesives",
+        "Keywords": "soy protein,adhesive,plywood",
+        "PI Name": "John Smith",
+        "PI Email": "jsmith@example.com",
+        "Organization": "Iowa State University",
+        "Priority Area": "New Uses",
+    },
+    {
+        **_BLANK_ROW,
+        "Title": "Soybean Oil in Biodiesel Production",
+        "DOI Link": "https://patents.google.com/patent/US12345",
+        "Type": "Patent",
+        "Submitted Year": "2022",
+        "Authors": "Doe, J.",
+        "Combined Authors": "Jane Doe",
+        "Funders": "United Soybean Board",
+        "USB Project Number Lookup": "2240-200-0100",
+        "USB #": "2240-200-0100",
+        "Investment Category": "Feed",
+        "Key Categories": "#NO MATCH",
+        "Keywords": "biodiesel;soybean oil",
+        "Priority Area": "#NO MATCH",
+    },
+)
+
+
+def _build_csv_text():
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    writer.writerow(_FIELDNAMES)
+    writer.writerows([row[name] for name in _FIELDNAMES] for row in _ROWS)
+    return buf.getvalue()
+
+
+_CSV_TEXT = _build_csv_text()
+
+
+@pytest.fixture(scope="session")
+def schema_db():
+    """Empty database with the schema applied once per session."""
+    db = Database(_SCHEMA_DB_URI)
+    db.init_schema()
+    yield db
+    db.close()
+
+
+@pytest.fixture
+def db(schema_db):
+    """Fresh, empty database per test, copied from ``schema_db``."""
+    db = Database(":memory:")
+    schema_db.copy_to(db)
+    yield db
+    db.close()
+
+
+@pytest.fixture
+def importer(db):
+    """USB deliverables importer over the per-test ``db``, with OA resolution off."""
+    return USBDeliverablesImporter(db=db, unpaywall_email=None)
+
+
+@pytest.fixture(scope="session")
+def sample_csv():
+    """Text of a small fixture CSV; wrap it in ``io.StringIO``."""
+    return _CSV_TEXT
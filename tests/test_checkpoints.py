@@ -20,14 +20,6 @@ from soyscope.db import Database
 # ---------------------------------------------------------------------------
 
 
-@pytest.fixture
-def db(tmp_path):
-    """Create a temporary database with schema initialised."""
-    database = Database(tmp_path / "test_checkpoints.db")
-    database.init_schema()
-    return database
-
-
 @pytest.fixture
 def run_id(db: Database) -> int:
     """Create a search run and return its id."""
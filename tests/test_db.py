@@ -17,6 +17,21 @@ def db(tmp_path):
     return db
 
 
+@pytest.fixture
+def open_database():
+    """Open ``Database`` objects for a test and close them all on teardown."""
+    opened = []
+
+    def make(db_path):
+        database = Database(db_path)
+        opened.append(database)
+        return database
+
+    yield make
+    for database in opened:
+        database.close()
+
+
 @pytest.fixture
 def sample_paper():
     return Paper(
@@ -196,3 +211,43 @@ class TestDatabase:
         assert len(rows) == 1
         assert rows[0]["enrichment_tier"] == "deep"
         assert rows[0]["novelty_score"] == 0.60
+
+
+class TestInMemoryDatabase:
+    def test_memory_db_persists_across_connections(self, open_database, sample_paper):
+        db = open_database(":memory:")
+        db.init_schema()
+        fid = db.insert_finding(sample_paper)
+        assert db.get_finding_by_id(fid)["title"] == sample_paper.title
+
+    def test_memory_dbs_are_isolated(self, open_database, sample_paper):
+        a, b = open_database(":memory:"), open_database(":memory:")
+        a.init_schema()
+        b.init_schema()
+        a.insert_finding(sample_paper)
+        assert a.get_findings_count() == 1
+        assert b.get_findings_count() == 0
+
+    def test_copy_to_snapshots_schema_and_rows(self, open_database, sample_paper):
+        src, dst = open_database(":memory:"), open_database(":memory:")
+        src.init_schema()
+        src.insert_finding(sample_paper)
+        src.copy_to(dst)
+        assert dst.get_findings_count() == 1
+        dst.insert_finding(Paper(title="Only in the copy", source_api="test"))
+        assert src.get_findings_count() == 1
+
+    def test_named_memory_uri_is_shared(self, open_database, sample_paper):
+        uri = "file:soyscope_named_test?mode=memory&cache=shared"
+        a, b = open_database(uri), open_database(uri)
+        assert a.in_memory and b.in_memory
+        a.init_schema()
+        a.insert_finding(sample_paper)
+        assert b.get_findings_count() == 1
+
+    def test_plain_memory_uri_keeps_data(self, open_database, sample_paper):
+        db = open_database("file::memory:?cache=shared")
+        assert db.in_memory
+        db.init_schema()
+        db.insert_finding(sample_paper)
+        assert db.get_findings_count() == 1
@@ -54,6 +54,15 @@ class TestFuzzyDuplication:
             "Biodiesel from soybean oil",
         )
 
+    def test_length_disparity_rejected(self):
+        assert not is_duplicate_title(
+            "Soy adhesive",
+            "Soy adhesive for construction panels and engineered wood products",
+        )
+
+    def test_low_threshold_not_rejected_by_length(self):
+        assert is_duplicate_title("Soy adhesive", "Soy adhesive for plywood", threshold=50.0)
+
 
 class TestDeduplicator:
     def test_doi_dedup(self):
@@ -101,3 +110,26 @@ class TestDeduplicator:
         unique = deduplicate_papers(papers, existing_dois={"10.1234/existing"})
         assert len(unique) == 1
         assert unique[0].doi == "10.1234/new"
+
+    def test_exact_title_returns_existing_id(self):
+        dedup = Deduplicator()
+        dedup.load_existing(
+            dois=set(),
+            titles=[(7, "Soy Protein Adhesive for Wood"), (8, "Biodiesel from soybean oil")],
+        )
+        p = Paper(title="soy protein adhesive, for wood", source_api="test")
+        assert dedup.is_duplicate(p) == (True, 7)
+
+    def test_registered_title_without_id(self):
+        dedup = Deduplicator()
+        dedup.register(Paper(title="Soy wax candles", source_api="test"))
+        assert dedup.is_duplicate(Paper(title="Soy wax candles", source_api="x")) == (True, None)
+
+    def test_register_after_load_existing_matches_doi(self):
+        dedup = Deduplicator()
+        dedup.load_existing(dois={"10.1234/old"}, titles=[])
+        p = Paper(title="Fresh paper", doi="10.1234/NEW", source_api="test")
+        assert not dedup.is_duplicate(p)[0]
+        dedup.register(p, db_id=5)
+        p2 = Paper(title="Other title", doi="https://doi.org/10.1234/new", source_api="x")
+        assert dedup.is_duplicate(p2) == (True, 5)
@@ -36,3 +36,22 @@ def test_evaluate_labeled_findings_coverage():
     assert metrics["evaluated_rows"] == 2
     assert metrics["rows_with_novelty"] == 1
     assert metrics["novelty_coverage"] == 0.5
+
+
+def test_evaluate_labeled_findings_skips_unlabeled_and_keeps_zero_scores():
+    rows = [
+        {"label": "relevant", "novelty_score": 0},      # FN, but has novelty
+        {"label": "irrelevant", "novelty_score": "n/a"},  # TN, no novelty
+        {"label": "unsure", "novelty_score": 0.95},
+    ]
+    metrics = evaluate_labeled_findings(rows, threshold=0.7)
+    assert metrics["skipped_labels"] == 1
+    assert metrics["evaluated_rows"] == 2
+    assert metrics["rows_with_novelty"] == 1
+    assert (metrics["tp"], metrics["fp"], metrics["fn"], metrics["tn"]) == (0, 0, 1, 1)
+
+
+def test_evaluate_labeled_findings_empty():
+    metrics = evaluate_labeled_findings([], threshold=0.7)
+    assert metrics["evaluated_rows"] == 0
+    assert metrics["f1"] == 0.0
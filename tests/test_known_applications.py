@@ -1,24 +1,9 @@
 """Tests for known_applications table, seed data, and CRUD operations."""
 
-import os
-import tempfile
-
-import pytest
-
-from soyscope.db import Database
 from soyscope.known_apps_seed import KNOWN_APPLICATIONS
 from soyscope.models import KnownApplication
 
 
-@pytest.fixture
-def db():
-    """Create a fresh in-memory-like DB for each test."""
-    db_path = os.path.join(tempfile.mkdtemp(), "test_ka.db")
-    database = Database(db_path)
-    database.init_schema()
-    return database
-
-
 # ---------------------------------------------------------------------------
 # KnownApplication model
 # ---------------------------------------------------------------------------
@@ -2,18 +2,10 @@
 
 import pytest
 
-from soyscope.db import Database
 from soyscope.dedup import Deduplicator, normalize_doi
 from soyscope.models import Paper, SourceType
 
 
-@pytest.fixture
-def db(tmp_path):
-    db = Database(tmp_path / "test.db")
-    db.init_schema()
-    return db
-
-
 @pytest.fixture
 def sample_paper():
     return Paper(
@@ -79,6 +71,18 @@ class TestFindingSources:
         doi_map = db.get_doi_to_id_map()
         assert doi_map["10.1234/test.2022.001"] == fid
 
+    def test_add_finding_sources_many(self, db, sample_paper):
+        fid = db.insert_finding(sample_paper)
+        db.add_finding_sources([(fid, "pubmed"), (fid, "crossref"), (fid, "pubmed")])
+        assert sorted(db.get_finding_sources(fid)) == ["crossref", "openalex", "pubmed"]
+
+    def test_batch_insert_skips_duplicates(self, db):
+        papers = [
+            Paper(title="Dup A", doi="10.1234/dup", source_api="crossref"),
+            Paper(title="Dup B", doi="10.1234/dup", source_api="crossref"),
+        ]
+        assert db.insert_findings_batch(papers) == (1, 1)
+
     def test_stats_multi_source(self, db, sample_paper):
         """Stats should include multi-source counts."""
         fid = db.insert_finding(sample_paper)
@@ -87,6 +91,11 @@ class TestFindingSources:
         assert stats["findings_with_multiple_sources"] == 1
         assert stats["avg_sources_per_finding"] > 1.0
 
+    def test_stats_multi_source_empty(self, db):
+        stats = db.get_stats()
+        assert stats["findings_with_multiple_sources"] == 0
+        assert stats["avg_sources_per_finding"] == 0.0
+
     def test_batch_insert_tracks_sources(self, db):
         """insert_findings_batch should also track sources."""
         papers = [
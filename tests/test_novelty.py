@@ -47,6 +47,11 @@ class TestFuzzySimilarity:
         assert _fuzzy_similarity("", "anything") == 0.0
         assert _fuzzy_similarity("anything", "") == 0.0
 
+    def test_prenormalized(self):
+        raw = "PureBond, Soy Adhesive!"
+        assert _fuzzy_similarity("PureBond adhesive", _normalize(raw), normalized=True) == \
+            _fuzzy_similarity("PureBond adhesive", raw)
+
 
 class TestKeywordOverlap:
     def test_full_overlap(self):
@@ -72,6 +77,11 @@ class TestKeywordOverlap:
         frac, matched = _keyword_overlap("adhesive", [])
         assert frac == 0.0
 
+    def test_prenormalized(self):
+        frac, matched = _keyword_overlap("adhesive sealant", ["adhesive", "glue"], normalized=True)
+        assert frac == 0.5
+        assert matched == ["adhesive"]
+
 
 # ---------------------------------------------------------------------------
 # Known applications fixture
@@ -231,6 +241,17 @@ class TestScoreFindingsBatch:
         results = score_findings_batch([], known_apps)
         assert results == []
 
+    def test_parallel_matches_serial(self, known_apps):
+        findings = [
+            {"id": 1, "title": "PureBond soy adhesive for plywood"},
+            {"id": 2, "title": "Novel quantum dot from soybean waste"},
+            {"id": 3, "title": "Soy wax candle market trends"},
+            {"id": 4, "title": "Envirotemp FR3 transformer fluid aging"},
+        ]
+        serial = score_findings_batch(findings, known_apps)
+        parallel = score_findings_batch(findings, known_apps, n_jobs=2)
+        assert parallel == serial
+
 
 # ---------------------------------------------------------------------------
 # get_novel_findings
@@ -1,8 +1,10 @@
 """Tests for query generator with synonym expansion, semantic queries, and Tier 1 routing."""
 
-import pytest
+import re
 from collections import Counter
 
+import pytest
+
 from soyscope.collectors.query_generator import (
     SOY_SYNONYMS,
     SEMANTIC_QUERIES,
@@ -12,9 +14,9 @@ from soyscope.collectors.query_generator import (
     _SEMANTIC_APIS,
     _WEB_APIS,
     QueryPlan,
+    QueryPlanBundle,
     expand_soy_synonyms,
     generate_academic_queries,
-    generate_full_query_plan,
     generate_govt_queries,
     generate_patent_queries,
     generate_refresh_queries,
@@ -22,6 +24,8 @@ from soyscope.collectors.query_generator import (
     generate_web_queries,
 )
 
+_SOY_RE = re.compile(r"\b(?:soy(?:bean|a)?|soja)\b", re.IGNORECASE)  # also covers "soy bean"
+
 
 # ---------------------------------------------------------------------------
 # SOY_SYNONYMS
@@ -84,12 +88,8 @@ class TestSemanticQueries:
 
     def test_no_soy_keyword(self):
         # These queries should NOT contain soy/soybean
-        soy_words = {"soy", "soybean", "soy bean", "soya", "soja"}
-        for q in SEMANTIC_QUERIES:
-            words = set(q.lower().split())
-            assert not words.intersection(soy_words), (
-                f"Semantic query should not mention soy directly: {q}"
-            )
+        hits = [q for q in SEMANTIC_QUERIES if _SOY_RE.search(q)]
+        assert not hits, f"Semantic queries should not mention soy directly: {hits}"
 
     def test_all_strings(self):
         for q in SEMANTIC_QUERIES:
@@ -148,16 +148,39 @@ class TestGenerateAcademicQueries:
 # generate_semantic_queries / generate_web_queries / generate_patent_queries / generate_govt_queries
 # ---------------------------------------------------------------------------
 
-class TestGenerateSemanticQueries:
-    def test_returns_queries(self):
-        result = generate_semantic_queries("Soy Oil", "Construction & Building Materials")
-        assert len(result) == 4  # 2 templates x 2 synonyms
-
-    def test_contains_derivative(self):
+_QUERY_COUNT_CASES = [
+    pytest.param(generate_semantic_queries, 4, id="semantic"),  # 2 templates x 2 synonyms
+    pytest.param(generate_web_queries, 4, id="web"),  # 2 templates x 2 synonyms
+    pytest.param(generate_patent_queries, 3, id="patent"),  # 3 derivative synonyms
+    pytest.param(generate_govt_queries, 4, id="govt"),  # 2 templates x 2 synonyms
+]
+
+_QUERY_KEYWORD_CASES = [
+    # (generator, keywords: some query must contain at least one of them)
+    pytest.param(generate_web_queries, ("commercial", "market"), id="web-market"),
+    pytest.param(generate_patent_queries, ("soybean oil",), id="patent-soybean"),
+    pytest.param(generate_patent_queries, ("soy bean oil",), id="patent-soy-bean"),
+    pytest.param(generate_patent_queries, ("adhesive",), id="patent-sector-keyword"),
+    pytest.param(generate_govt_queries, ("research",), id="govt-research"),
+    pytest.param(generate_govt_queries, ("biobased",), id="govt-biobased"),
+]
+
+
+class TestGenerateTypedQueries:
+    @pytest.mark.parametrize("gen, expected", _QUERY_COUNT_CASES)
+    def test_query_count(self, gen, expected):
+        assert len(gen("Soy Oil", "Construction & Building Materials")) == expected
+
+    @pytest.mark.parametrize("gen, keywords", _QUERY_KEYWORD_CASES)
+    def test_query_content(self, gen, keywords):
+        result = gen("Soy Oil", "Construction & Building Materials")
+        assert any(kw in q for q in result for kw in keywords), f"No query contains any of {keywords}"
+
+    def test_semantic_contains_derivative(self):
         result = generate_semantic_queries("Soy Oil", "Construction & Building Materials")
         assert any("soy oil" in q.lower() for q in result)
 
-    def test_uses_two_synonyms(self):
+    def test_semantic_uses_two_synonyms(self):
         result = generate_semantic_queries("Soy Oil", "Construction & Building Materials")
         has_soy = any(q.startswith("soy ") or " soy " in q for q in result)
         has_soybean = any("soybean" in q for q in result)
@@ -165,55 +188,30 @@ class TestGenerateSemanticQueries:
         assert has_soybean
 
 
-class TestGenerateWebQueries:
-    def test_returns_queries(self):
-        result = generate_web_queries("Soy Oil", "Construction & Building Materials")
-        assert len(result) == 4  # 2 templates x 2 synonyms
-
-    def test_contains_market_language(self):
-        result = generate_web_queries("Soy Oil", "Construction & Building Materials")
-        has_commercial = any("commercial" in q or "market" in q for q in result)
-        assert has_commercial
-
-
-class TestGeneratePatentQueries:
-    def test_returns_queries(self):
-        result = generate_patent_queries("Soy Oil", "Construction & Building Materials")
-        assert len(result) == 3  # 3 derivative synonyms (Soy Oil, Soybean Oil, Soy Bean Oil)
-
-    def test_derivative_synonym_expansion(self):
-        result = generate_patent_queries("Soy Oil", "Construction & Building Materials")
-        assert any("soybean oil" in q for q in result)
-        assert any("soy bean oil" in q for q in result)
-        assert any("adhesive" in q for q in result)  # uses sector keyword
-
-
-class TestGenerateGovtQueries:
-    def test_returns_queries(self):
-        result = generate_govt_queries("Soy Oil", "Construction & Building Materials")
-        assert len(result) == 4  # 2 templates x 2 synonyms
-
-    def test_contains_research_keyword(self):
-        result = generate_govt_queries("Soy Oil", "Construction & Building Materials")
-        has_research = any("research" in q for q in result)
-        has_biobased = any("biobased" in q for q in result)
-        assert has_research
-        assert has_biobased
-
-
 # ---------------------------------------------------------------------------
 # generate_full_query_plan
 # ---------------------------------------------------------------------------
 
 class TestGenerateFullQueryPlan:
-    def test_returns_query_plans(self):
-        plans = generate_full_query_plan(time_windows=[(2020, 2026)])
+    def test_returns_query_plans(self, full_plans_2020_2026):
+        plans = full_plans_2020_2026
         assert len(plans) > 0
         assert all(isinstance(p, QueryPlan) for p in plans)
 
-    def test_includes_all_query_types(self):
-        plans = generate_full_query_plan(time_windows=[(2020, 2026)])
-        types = {p.query_type for p in plans}
+    def test_by_type_partitions_plans(self, full_plans_2020_2026):
+        plans = full_plans_2020_2026
+        assert isinstance(plans, QueryPlanBundle)
+        assert sum(len(group) for group in plans.by_type.values()) == len(plans)
+
+    def test_bundle_is_immutable(self, full_plans_2020_2026):
+        plans = full_plans_2020_2026
+        assert isinstance(plans, tuple)
+        with pytest.raises(AttributeError):
+            plans.append(plans[0])
+
+    def test_includes_all_query_types(self, full_plans_2020_2026):
+        plans = full_plans_2020_2026
+        types = set(plans.by_type)
         assert "academic" in types
         assert "semantic" in types
         assert "web" in types
@@ -221,42 +219,42 @@ class TestGenerateFullQueryPlan:
         assert "govt" in types
         assert "implicit_semantic" in types
 
-    def test_academic_routes_to_tier1(self):
-        plans = generate_full_query_plan(time_windows=[(2020, 2026)])
-        academic = [p for p in plans if p.query_type == "academic"]
+    def test_academic_routes_to_tier1(self, full_plans_2020_2026):
+        plans = full_plans_2020_2026
+        academic = plans.by_type["academic"]
         for p in academic:
             assert "agris" in p.target_apis, "Academic queries must route to agris"
             assert "openalex" in p.target_apis
 
-    def test_patent_routes_to_patentsview_and_lens(self):
-        plans = generate_full_query_plan(time_windows=[(2020, 2026)])
-        patent = [p for p in plans if p.query_type == "patent"]
+    def test_patent_routes_to_patentsview_and_lens(self, full_plans_2020_2026):
+        plans = full_plans_2020_2026
+        patent = plans.by_type["patent"]
         assert len(patent) > 0
         for p in patent:
             assert "patentsview" in p.target_apis
             assert "lens" in p.target_apis
 
-    def test_govt_routes_to_osti_sbir_usda(self):
-        plans = generate_full_query_plan(time_windows=[(2020, 2026)])
-        govt = [p for p in plans if p.query_type == "govt"]
+    def test_govt_routes_to_osti_sbir_usda(self, full_plans_2020_2026):
+        plans = full_plans_2020_2026
+        govt = plans.by_type["govt"]
         assert len(govt) > 0
         for p in govt:
             assert "osti" in p.target_apis
             assert "sbir" in p.target_apis
             assert "usda_ers" in p.target_apis
 
-    def test_implicit_semantic_queries_included(self):
-        plans = generate_full_query_plan(time_windows=[(2020, 2026)])
-        implicit = [p for p in plans if p.query_type == "implicit_semantic"]
+    def test_implicit_semantic_queries_included(self, full_plans_2020_2026):
+        plans = full_plans_2020_2026
+        implicit = plans.by_type["implicit_semantic"]
         assert len(implicit) == len(SEMANTIC_QUERIES)
         for p in implicit:
             assert p.derivative is None
             assert p.sector is None
             assert "exa" in p.target_apis
 
-    def test_time_windows_applied(self):
-        plans = generate_full_query_plan(time_windows=[(2020, 2026)])
-        academic = [p for p in plans if p.query_type == "academic"]
+    def test_time_windows_applied(self, full_plans_2020_2026):
+        plans = full_plans_2020_2026
+        academic = plans.by_type["academic"]
         for p in academic:
             assert p.year_start == 2020
             assert p.year_end == 2026
@@ -273,7 +271,7 @@ class TestGenerateRefreshQueries:
 
     def test_includes_all_query_types(self):
         plans = generate_refresh_queries(since_year=2024)
-        types = {p.query_type for p in plans}
+        types = set(plans.by_type)
         assert "academic" in types
         assert "web" in types
         assert "patent" in types
@@ -287,17 +285,17 @@ class TestGenerateRefreshQueries:
                 assert p.year_start == 2024
                 assert p.year_end == 2026
 
-    def test_lighter_than_full_build(self):
-        full = generate_full_query_plan(time_windows=[(2020, 2026)])
+    def test_lighter_than_full_build(self, full_plans_2020_2026):
+        full = full_plans_2020_2026
         refresh = generate_refresh_queries(since_year=2020)
         assert len(refresh) < len(full), "Refresh should be lighter than full build"
 
     def test_tier1_routing_in_refresh(self):
         plans = generate_refresh_queries(since_year=2024)
-        academic = [p for p in plans if p.query_type == "academic"]
+        academic = plans.by_type["academic"]
         for p in academic:
             assert "agris" in p.target_apis
-        patent = [p for p in plans if p.query_type == "patent"]
+        patent = plans.by_type["patent"]
         for p in patent:
             assert "patentsview" in p.target_apis
 
@@ -0,0 +1,24 @@
+"""Shared fixtures for source adapter tests."""
+
+import httpx
+import pytest
+import pytest_asyncio
+import respx
+
+# Routes are declared per test; unmatched requests raise instead of hitting the network.
+_ROUTER = respx.Router(assert_all_called=False)
+
+
+@pytest.fixture
+def mock_router():
+    """The session-wide respx router, with routes and call history cleared for this test."""
+    _ROUTER.clear()
+    _ROUTER.reset()
+    return _ROUTER
+
+
+@pytest_asyncio.fixture(scope="session")
+async def shared_client():
+    """One AsyncClient over the respx router, injected into adapters via ``client=``."""
+    async with httpx.AsyncClient(transport=httpx.MockTransport(_ROUTER.handler)) as client:
+        yield client
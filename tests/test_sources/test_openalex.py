@@ -1,7 +1,8 @@
 """Tests for OpenAlex source adapter (mocked)."""
 
+import httpx
 import pytest
-from unittest.mock import AsyncMock, patch, MagicMock
+import respx
 
 from soyscope.sources.openalex_source import OpenAlexSource
 
@@ -12,26 +13,19 @@ class TestOpenAlexSource:
         assert source.name == "openalex"
 
     @pytest.mark.asyncio
+    @respx.mock
     async def test_search_empty(self):
+        respx.get(url__startswith="https://api.openalex.org/").mock(
+            return_value=httpx.Response(200, json={"results": [], "meta": {"count": 0}})
+        )
         source = OpenAlexSource(email="test@example.com")
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"results": [], "meta": {"count": 0}}
 
-        with patch("httpx.AsyncClient") as mock_client_class:
-            mock_client = AsyncMock()
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=False)
-            mock_client.get = AsyncMock(return_value=mock_response)
-            mock_client_class.return_value = mock_client
-
-            result = await source.search("nonexistent query")
-            assert result.papers == [] or len(result.papers) == 0
+        result = await source.search("nonexistent query")
+        assert result.papers == []
 
     @pytest.mark.asyncio
+    @respx.mock
     async def test_search_with_results(self):
-        source = OpenAlexSource(email="test@example.com")
-
         mock_work = {
             "id": "https://openalex.org/W12345",
             "doi": "https://doi.org/10.1234/test",
@@ -54,21 +48,12 @@ class TestOpenAlexSource:
                 "plywood": [3],
             },
         }
+        route = respx.get(url__startswith="https://api.openalex.org/works").mock(
+            return_value=httpx.Response(200, json={"results": [mock_work], "meta": {"count": 1}})
+        )
+        source = OpenAlexSource(email="test@example.com")
 
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "results": [mock_work],
-            "meta": {"count": 1},
-        }
-
-        with patch("httpx.AsyncClient") as mock_client_class:
-            mock_client = AsyncMock()
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=False)
-            mock_client.get = AsyncMock(return_value=mock_response)
-            mock_client_class.return_value = mock_client
-
-            result = await source.search("soy adhesive")
-            assert len(result.papers) == 1
-            assert "soy" in result.papers[0].title.lower() or "adhesive" in result.papers[0].title.lower()
+        result = await source.search("soy adhesive")
+        assert route.called
+        assert len(result.papers) == 1
+        assert "soy" in result.papers[0].title.lower() or "adhesive" in result.papers[0].title.lower()
@@ -1,228 +1,104 @@
 """Tests for USB deliverables importer."""
 
-import csv
-import tempfile
+import io
+import re
+import sqlite3
 from pathlib import Path
 
 import pytest
 
-from soyscope.db import Database
-from soyscope.models import SourceType, USBDeliverable
+from soyscope.models import Paper, SourceType, USBDeliverable
 from soyscope.collectors.usb_deliverables_importer import (
-    USBDeliverablesImporter,
+    _DOI_RE,
+    _SENTINELS,
+    _TYPE_MAP,
     _clean_no_match,
     _extract_doi,
     _map_source_type,
 )
 
 
-@pytest.fixture
-def db(tmp_path):
-    db = Database(tmp_path / "test.db")
-    db.init_schema()
-    return db
-
-
-@pytest.fixture
-def importer(db):
-    return USBDeliverablesImporter(db=db, unpaywall_email=None)
-
-
-@pytest.fixture
-def sample_csv(tmp_path):
-    """Create a small fixture CSV file."""
-    csv_path = tmp_path / "test_deliverables.csv"
-    rows = [
-        {
-            "Title": "Soy Protein Adhesive for Plywood",
-            "DOI Link": "https://doi.org/10.1234/soy.2023.001",
-            "Type": "Primary Research",
-            "Submitted Year": "",
-            "Published Year": "2023",
-            "Month": "Jun",
-            "Journal Name": "Journal of Adhesion",
-            "Authors": "Smith, J., Doe, J.",
-            "Combined Authors": "",
-            "Funders": "United Soybean Board",
-            "Award Numbers": "",
-            "Smithbucklin Project Number": "",
-            "USB Project Number Lookup": "#NO MATCH",
-            "USB #": "2340-101-0001",
-            "Project Number": "2340-101-0001",
-            "Target Area": "",
-            "Fiscal Year": "",
-            "Investment Category": "Industrial",
-            "Action Team": "",
-            "Program Name": "",
-            "Sub-Program Name": "",
-            "Key Categories": "Adhesives",
-            "Keywords": "soy protein,adhesive,plywood",
-            "PI Name": "John Smith",
-            "PI Email": "jsmith@example.com",
-            "Organization": "Iowa State University",
-            "Program Manager": "",
-            "Program Manager Email": "",
-            "Project Manager Email": "",
-            "Date of Last Change": "",
-            "Quarter": "",
-            "Date of Last PI Update": "",
-            "Status": "",
-            "Targeted Journal(s)": "",
-            "Submitted by Name": "",
-            "Priority Area": "New Uses",
-            "Submitted By Email": "",
-            "Current Program Manager": "",
-            "Do you need funds for publishing open access?": "",
-            "Project Manager": "",
-            "Created": "",
-            "Send Approval Notification": "",
-            "Re-email PM": "",
-            "Send Notification Email": "",
-            "Smartsheet Admin Email": "",
-            "Additional Project Numbers": "",
-            "Journal Response": "",
-        },
-        {
-            "Title": "Soybean Oil in Biodiesel Production",
-            "DOI Link": "https://patents.google.com/patent/US12345",
-            "Type": "Patent",
-            "Submitted Year": "2022",
-            "Published Year": "",
-            "Month": "",
-            "Journal Name": "",
-            "Authors": "Doe, J.",
-            "Combined Authors": "Jane Doe",
-            "Funders": "United Soybean Board",
-            "Award Numbers": "",
-            "Smithbucklin Project Number": "",
-            "USB Project Number Lookup": "2240-200-0100",
-            "USB #": "2240-200-0100",
-            "Project Number": "",
-            "Target Area": "",
-            "Fiscal Year": "",
-            "Investment Category": "Feed",
-            "Action Team": "",
-            "Program Name": "",
-            "Sub-Program Name": "",
-            "Key Categories": "#NO MATCH",
-            "Keywords": "biodiesel;soybean oil",
-            "PI Name": "",
-            "PI Email": "",
-            "Organization": "",
-            "Program Manager": "",
-            "Program Manager Email": "",
-            "Project Manager Email": "",
-            "Date of Last Change": "",
-            "Quarter": "",
-            "Date of Last PI Update": "",
-            "Status": "",
-            "Targeted Journal(s)": "",
-            "Submitted by Name": "",
-            "Priority Area": "#NO MATCH",
-            "Submitted By Email": "",
-            "Current Program Manager": "",
-            "Do you need funds for publishing open access?": "",
-            "Project Manager": "",
-            "Created": "",
-            "Send Approval Notification": "",
-            "Re-email PM": "",
-            "Send Notification Email": "",
-            "Smartsheet Admin Email": "",
-            "Additional Project Numbers": "",
-            "Journal Response": "",
-        },
-    ]
-
-    with open(csv_path, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=rows[0].keys())
-        writer.writeheader()
-        writer.writerows(rows)
-
-    return csv_path
-
-
 class TestCleanNoMatch:
-    def test_no_match(self):
-        assert _clean_no_match("#NO MATCH") is None
-
-    def test_no_match_lowercase(self):
-        assert _clean_no_match("#no match") is None
-
-    def test_empty(self):
-        assert _clean_no_match("") is None
-
-    def test_none(self):
-        assert _clean_no_match(None) is None
-
-    def test_valid(self):
-        assert _clean_no_match("Industrial") == "Industrial"
+    @pytest.mark.parametrize("value, expected", [
+        pytest.param("#NO MATCH", None, id="no_match"),
+        pytest.param("#no match", None, id="no_match_lowercase"),
+        pytest.param("", None, id="empty"),
+        pytest.param(None, None, id="none"),
+        pytest.param("  #No Match ", None, id="no_match_padded"),
+        pytest.param("N/A", None, id="n_a"),
+        pytest.param("na", None, id="na"),
+        pytest.param("None", None, id="none_text"),
+        pytest.param("   ", None, id="whitespace"),
+        pytest.param("Industrial", "Industrial", id="valid"),
+        pytest.param(" Feed ", "Feed", id="valid_stripped"),
+    ])
+    def test_clean(self, value, expected):
+        assert _clean_no_match(value) == expected
+
+    def test_clean_no_match_is_cached(self):
+        hits = _clean_no_match.cache_info().hits
+        _clean_no_match("Cached Category")
+        _clean_no_match("Cached Category")
+        assert _clean_no_match.cache_info().hits > hits
 
 
 class TestExtractDoi:
-    def test_standard_url(self):
-        assert _extract_doi("https://doi.org/10.1234/test.2023.001") == "10.1234/test.2023.001"
-
-    def test_embedded_doi(self):
-        assert _extract_doi("Some text 10.5678/abc.123 more text") == "10.5678/abc.123"
-
-    def test_patent_url_returns_none(self):
-        assert _extract_doi("https://patents.google.com/patent/US12345") is None
-
-    def test_none_input(self):
-        assert _extract_doi(None) is None
-
-    def test_empty_string(self):
-        assert _extract_doi("") is None
-
-    def test_no_doi_link(self):
-        assert _extract_doi("https://example.com/some-page") is None
-
-    def test_bare_doi(self):
-        assert _extract_doi("10.1093/jas/skaf349") == "10.1093/jas/skaf349"
-
-    def test_trailing_punctuation_stripped(self):
-        assert _extract_doi("https://doi.org/10.1234/test.001.") == "10.1234/test.001"
+    @pytest.mark.parametrize("value, expected", [
+        pytest.param("https://doi.org/10.1234/test.2023.001", "10.1234/test.2023.001", id="standard_url"),
+        pytest.param("Some text 10.5678/abc.123 more text", "10.5678/abc.123", id="embedded_doi"),
+        pytest.param("https://patents.google.com/patent/US12345", None, id="patent_url"),
+        pytest.param(None, None, id="none_input"),
+        pytest.param("", None, id="empty_string"),
+        pytest.param("https://example.com/some-page", None, id="no_doi_link"),
+        pytest.param("10.1093/jas/skaf349", "10.1093/jas/skaf349", id="bare_doi"),
+        pytest.param("https://doi.org/10.1234/test.001.", "10.1234/test.001", id="trailing_punctuation"),
+    ])
+    def test_extract(self, value, expected):
+        assert _extract_doi(value) == expected
 
 
 class TestTypeMapping:
-    def test_primary_research(self):
-        assert _map_source_type("Primary Research") == SourceType.PAPER
-
-    def test_review(self):
-        assert _map_source_type("Review") == SourceType.PAPER
-
-    def test_meta_analysis(self):
-        assert _map_source_type("Meta Analysis") == SourceType.PAPER
-
-    def test_modeling(self):
-        assert _map_source_type("Modeling") == SourceType.PAPER
-
-    def test_methodology(self):
-        assert _map_source_type("Methodology") == SourceType.PAPER
-
-    def test_response_commentary(self):
-        assert _map_source_type("Response/Commentary") == SourceType.PAPER
-
-    def test_book_chapter(self):
-        assert _map_source_type("Book Chapter") == SourceType.PAPER
-
-    def test_proceedings(self):
-        assert _map_source_type("Proceedings Article") == SourceType.CONFERENCE
-
-    def test_patent(self):
-        assert _map_source_type("Patent") == SourceType.PATENT
-
-    def test_survey(self):
-        assert _map_source_type("Survey") == SourceType.REPORT
-
-    def test_strategic_plan(self):
-        assert _map_source_type("Strategic Plan") == SourceType.REPORT
-
-    def test_unknown_defaults_paper(self):
-        assert _map_source_type("Something New") == SourceType.PAPER
-
-    def test_none_defaults_paper(self):
-        assert _map_source_type(None) == SourceType.PAPER
+    @pytest.mark.parametrize("label, expected", [
+        ("Primary Research", SourceType.PAPER),
+        ("Review", SourceType.PAPER),
+        ("Meta Analysis", SourceType.PAPER),
+        ("Modeling", SourceType.PAPER),
+        ("Methodology", SourceType.PAPER),
+        ("Response/Commentary", SourceType.PAPER),
+        ("Book Chapter", SourceType.PAPER),
+        ("Proceedings Article", SourceType.CONFERENCE),
+        ("Patent", SourceType.PATENT),
+        ("Survey", SourceType.REPORT),
+        ("Strategic Plan", SourceType.REPORT),
+        pytest.param("Something New", SourceType.PAPER, id="unknown_defaults_paper"),
+        pytest.param(None, SourceType.PAPER, id="none_defaults_paper"),
+    ])
+    def test_map(self, label, expected):
+        assert _map_source_type(label) == expected
+
+    def test_map_source_type_is_cached(self):
+        hits = _map_source_type.cache_info().hits
+        _map_source_type("Primary Research")
+        _map_source_type("Primary Research")
+        assert _map_source_type.cache_info().hits > hits
+
+    @pytest.mark.parametrize("label, expected", sorted(_TYPE_MAP.items()))
+    def test_every_type_map_entry(self, label, expected):
+        assert _map_source_type(label) == expected
+        assert _map_source_type(label.title()) == expected
+
+
+class TestPerformanceInvariants:
+    """Hot-path lookup tables keep their precompiled / hashable types."""
+
+    def test_doi_regex_is_pattern(self):
+        assert isinstance(_DOI_RE, re.Pattern)
+
+    def test_type_map_is_dict(self):
+        assert isinstance(_TYPE_MAP, dict)
+
+    def test_sentinels_is_frozenset(self):
+        assert isinstance(_SENTINELS, frozenset)
 
 
 class TestParseRow:
@@ -286,6 +162,17 @@ class TestParseRow:
         assert d.key_categories is None
         assert d.priority_area is None
 
+    @pytest.mark.parametrize("raw, expected", [
+        ("a,b,c", ["a", "b", "c"]),
+        ("a; b;c", ["a", "b", "c"]),
+        ("soy oil / biodiesel", ["soy oil", "biodiesel"]),
+        (" a ,, b ; ", ["a", "b"]),
+        ("", []),
+    ])
+    def test_keyword_splitting(self, importer, raw, expected):
+        d = importer._parse_row({"Title": "Test", "Keywords": raw})
+        assert d.keywords == expected
+
 
 class TestCreatePaperFromDeliverable:
     def test_standard(self, importer):
@@ -358,8 +245,19 @@ class TestDbInsertDeliverable:
         db.insert_usb_deliverable(d2)
         assert db.get_usb_deliverables_count() == 2
 
+    def test_count_batched(self, db):
+        batch = [
+            USBDeliverable(title=f"Test {i}", doi_link=f"https://doi.org/10.1234/{i}")
+            for i in range(3)
+        ]
+        assert db.insert_usb_deliverables_many(batch) == 3
+        # Re-inserting skips every duplicate; one new record gets through
+        batch.append(USBDeliverable(title="Test 3", doi_link="https://doi.org/10.1234/3"))
+        assert db.insert_usb_deliverables_many(batch) == 1
+        assert db.insert_usb_deliverables_many([]) == 0
+        assert db.get_usb_deliverables_count() == 4
+
     def test_update_finding_oa(self, db):
-        from soyscope.models import Paper, SourceType
         paper = Paper(
             title="OA Test Paper",
             doi="10.9999/oa.test",
@@ -375,41 +273,58 @@ class TestDbInsertDeliverable:
 
 class TestImportFromCsv:
     @pytest.mark.asyncio
-    async def test_import_basic(self, db, sample_csv):
-        importer = USBDeliverablesImporter(db=db, unpaywall_email=None)
-        result = await importer.import_from_csv(sample_csv, resolve_oa=False)
+    async def test_import_basic(self, db, importer, sample_csv):
+        result = await importer.import_from_csv(io.StringIO(sample_csv), resolve_oa=False)
         assert result["total_rows"] == 2
         assert result["raw_imported"] == 2
         assert result["findings_added"] >= 1  # at least the DOI one
         assert db.get_usb_deliverables_count() == 2
 
     @pytest.mark.asyncio
-    async def test_idempotent_reimport(self, db, sample_csv):
-        importer = USBDeliverablesImporter(db=db, unpaywall_email=None)
-        r1 = await importer.import_from_csv(sample_csv, resolve_oa=False)
-        r2 = await importer.import_from_csv(sample_csv, resolve_oa=False)
-        # Second run should skip all raw records as duplicates
+    async def test_idempotent_reimport(self, db, importer, sample_csv):
+        r1 = await importer.import_from_csv(io.StringIO(sample_csv), resolve_oa=False)
+        r2 = await importer.import_from_csv(io.StringIO(sample_csv), resolve_oa=False)
+        assert r1["raw_imported"] == 2
+        # Second run should skip all raw records and findings as duplicates
+        assert r2["raw_imported"] == 0
         assert r2["raw_skipped"] == 2
+        assert r2["findings_added"] == 0
+        assert r2["findings_skipped"] == 2
         # Total in DB should still be 2
         assert db.get_usb_deliverables_count() == 2
 
     @pytest.mark.asyncio
-    async def test_stats_include_deliverables(self, db, sample_csv):
-        importer = USBDeliverablesImporter(db=db, unpaywall_email=None)
-        await importer.import_from_csv(sample_csv, resolve_oa=False)
+    async def test_stats_include_deliverables(self, db, importer, sample_csv):
+        await importer.import_from_csv(io.StringIO(sample_csv), resolve_oa=False)
         stats = db.get_stats()
         assert stats["total_usb_deliverables"] == 2
         assert "usb_deliverables" in stats["by_source"]
 
     @pytest.mark.asyncio
-    async def test_file_not_found(self, db):
-        importer = USBDeliverablesImporter(db=db, unpaywall_email=None)
+    async def test_import_from_path(self, db, importer, sample_csv, tmp_path):
+        csv_path = tmp_path / "test_deliverables.csv"
+        csv_path.write_text(sample_csv, encoding="utf-8", newline="")
+        result = await importer.import_from_csv(csv_path, resolve_oa=False)
+        assert result["raw_imported"] == 2
+        assert db.get_usb_deliverables_count() == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_falls_back_to_per_row(self, db, importer, sample_csv, monkeypatch):
+        def failing_batch(deliverables):
+            raise sqlite3.OperationalError("database is locked")
+
+        monkeypatch.setattr(db, "insert_usb_deliverables_many", failing_batch)
+        result = await importer.import_from_csv(io.StringIO(sample_csv), resolve_oa=False)
+        assert result["raw_imported"] == 2
+        assert result["raw_skipped"] == 0
+        assert db.get_usb_deliverables_count() == 2
+
+    def test_file_not_found(self, importer):
         with pytest.raises(FileNotFoundError):
-            await importer.import_from_csv(Path("/nonexistent/file.csv"), resolve_oa=False)
+            importer._validate_path(Path("/nonexistent/file.csv"))
 
     @pytest.mark.asyncio
-    async def test_keywords_tagged(self, db, sample_csv):
-        importer = USBDeliverablesImporter(db=db, unpaywall_email=None)
-        await importer.import_from_csv(sample_csv, resolve_oa=False)
+    async def test_keywords_tagged(self, db, importer, sample_csv):
+        await importer.import_from_csv(io.StringIO(sample_csv), resolve_oa=False)
         stats = db.get_stats()
         assert stats["total_tags"] > 0